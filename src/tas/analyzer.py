@@ -18,14 +18,14 @@ import logging
 from classifier import TenseClassifier
 from models import (
     TenseClass,
-    GraphOperation,
     SentenceAnalysis,
     TASOutput,
-    TENSE_CLASS_DISPLAY_NAMES,
-    TENSE_TO_TEMPORAL_ORIENTATION,
-    TENSE_TO_DEFAULT_GRAPH_OPERATION,
+    TENSE_CLASS_TO_INDEX,
+    TENSE_DISPLAY_NAMES_BY_INDEX,
+    TENSE_ORIENTATIONS_BY_INDEX,
+    TENSE_GRAPH_OPERATIONS_BY_INDEX,
 )
-from zimbardo import ZimbardoAccumulator
+from zimbardo import ZimbardoAccumulator, get_sentiment_modifier
 from migration import MigrationDetector, detect_contrast_markers
 
 # ============================================================================
@@ -156,7 +156,7 @@ class TASAnalyzer:
                 contrib = self.zimbardo_accumulator.add_tense_contribution(
                     analysis.tense_class,
                     analysis.hedge_score,
-                    analysis.text
+                    analysis.sentiment_modifier
                 )
                 
                 # Accumulate delta
@@ -195,13 +195,12 @@ class TASAnalyzer:
         # Determine self-referentiality
         self_ref = is_self_referential(text)
 
-        # Extract root verb lemma from features (not the full sentence string)
+        # TenseFeatures doesn't carry the root verb lemma (spaCy extracts
+        # it internally but only derived flags are kept), so tense_morph
+        # serves as a proxy label — best available without re-parsing
         root_verb = None
         if features is not None:
-            # TenseFeatures stores the full sentence in .sentence
-            # The actual root verb lemma is extracted via spaCy internally
-            # We use tense_morph as a proxy label since root lemma isn't stored separately
-            root_verb = features.tense_morph  # e.g. "Pres", "Past" — best available without re-parsing
+            root_verb = features.tense_morph.label  # e.g. "Pres", "Past"
 
         # Hedge score: classifier's hedge_score runs 0.0–1.0 where LOWER = more hedged.
         # This matches the weight_modifier semantics (1.0 = full weight, 0.0 = no weight).
@@ -212,10 +211,16 @@ class TASAnalyzer:
 
         # Hedge words are not separately stored by classifier features;
         # hedge_score captures the aggregate signal.
-        hedge_words = []
+        hedge_words = ()
 
-        # Get graph operation — now works correctly since both sides use models.TenseClass
-        graph_op = TENSE_TO_DEFAULT_GRAPH_OPERATION.get(tense_class, GraphOperation.NO_OPERATION)
+        # Sentiment scanned once here; the Zimbardo accumulator consumes
+        # the modifier instead of re-scanning the text
+        sentiment_mod = get_sentiment_modifier(text)
+
+        # Resolve the tense class to its index once; the display name,
+        # orientation, and graph operation are then indexed loads
+        tense_idx = TENSE_CLASS_TO_INDEX[tense_class]
+        graph_op = TENSE_GRAPH_OPERATIONS_BY_INDEX[tense_idx]
 
         # Determine flags
         flags = []
@@ -228,22 +233,29 @@ class TASAnalyzer:
         if tense_class == TenseClass.COUNTERFACTUAL_PAST:
             flags.append("regret_marker")
 
-        return SentenceAnalysis(
+        # model_construct skips per-field validation: every value here is
+        # produced by our own pipeline and already within bounds, so the
+        # pydantic validation pass is pure overhead. External input
+        # (TASInput) keeps full validation.
+        return SentenceAnalysis.model_construct(
             text=text,
             root_verb=root_verb,
-            grammatical_tense=features.tense_morph if features is not None else "Unknown",
+            grammatical_tense=features.tense_morph.label if features is not None else "Unknown",
             tense_class=tense_class,
-            tense_class_name=TENSE_CLASS_DISPLAY_NAMES[tense_class],
-            temporal_orientation=TENSE_TO_TEMPORAL_ORIENTATION[tense_class],
+            tense_class_name=TENSE_DISPLAY_NAMES_BY_INDEX[tense_idx],
+            temporal_orientation=TENSE_ORIENTATIONS_BY_INDEX[tense_idx],
             self_referential=self_ref,
             hedge_score=weight_modifier,
             hedge_words=hedge_words,
+            sentiment_modifier=sentiment_mod,
             confidence=confidence,
             zimbardo_contribution={},
             graph_operation=graph_op,
             target_node_hint=None,
             weight_modifier=weight_modifier,
-            flags=flags,
+            # model_construct skips coercion, so hand over the tuple the
+            # field type promises
+            flags=tuple(flags),
         )
 
 
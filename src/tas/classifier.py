@@ -11,28 +11,70 @@ Run with: python classifier_spacy.py
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Tuple
-from enum import Enum
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Callable, Sequence, Tuple
+from enum import IntEnum
+from operator import itemgetter
+import functools
+import heapq
 import logging
-import spacy
 
 from models import TenseClass
+from nlp_loader import get_nlp
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
+# No basicConfig here: configuring the root logger is the application's
+# job, and doing it on import surprises downstream embedders. The CLI
+# entry point below configures logging itself.
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(message)s'
-)
 logger = logging.getLogger(__name__)
 
+class TenseMorph(IntEnum):
+    """
+    Normalized morphological tense of the root verb.
 
-@dataclass
+    Int-valued so the scoring rules compare enum members by identity
+    (a pointer check) instead of string contents.
+    """
+
+    UNKNOWN = 0
+    PRES = 1
+    PAST = 2
+    PERF = 3
+
+    @property
+    def label(self) -> str:
+        """spaCy-style label ('Pres', 'Past', ...) for display/output."""
+        return _MORPH_LABELS[self]
+
+
+_MORPH_LABELS = {
+    TenseMorph.UNKNOWN: "Unknown",
+    TenseMorph.PRES: "Pres",
+    TenseMorph.PAST: "Past",
+    TenseMorph.PERF: "Perf",
+}
+
+# Mapping from spaCy's Tense morph value to the enum
+_MORPH_FROM_LABEL = {
+    "Pres": TenseMorph.PRES,
+    "Past": TenseMorph.PAST,
+    "Perf": TenseMorph.PERF,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class TenseFeatures:
-    """Extracted linguistic features"""
+    """
+    Extracted linguistic features.
+
+    Frozen: classification results are cached and shared between
+    callers (see TenseClassifier), so nothing downstream may mutate
+    a features object. The analyzer only ever reads these.
+    """
     has_modal_will: bool = False
     has_modal_would: bool = False
     has_modal_should: bool = False
@@ -44,30 +86,82 @@ class TenseFeatures:
     has_habitual_adverb: bool = False
     has_perfective_aspect: bool = False
     has_progressive_aspect: bool = False
-    tense_morph: str = "Unknown"
+    tense_morph: TenseMorph = TenseMorph.UNKNOWN
     emotion_words_count: int = 0
     narrative_markers_count: int = 0
     belief_verb: bool = False
     fatalistic_phrase: bool = False
+    has_have_been: bool = False
+    has_has_been: bool = False
     hedge_score: float = 0.5
     first_person: bool = False
-    sentence: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassificationResult:
-    """Result of classification"""
+    """
+    Result of classification.
+
+    Frozen because TenseClassifier.classify is lru_cache'd: every
+    caller with the same sentence gets this same object, so mutating
+    it would poison the cache for everyone else.
+    """
     sentence: str
     tense_class: TenseClass
     confidence: float
-    all_scores: Dict[TenseClass, float] = field(default_factory=dict)
+    # Immutable empty defaults: no per-instance allocation when a field
+    # is left unset (classify always fills them in anyway)
+    all_scores: Optional[Mapping[TenseClass, float]] = None
     features: Optional[TenseFeatures] = None
-    top_3_predictions: List[Tuple[TenseClass, float]] = field(default_factory=list)
+    top_3_predictions: Sequence[Tuple[TenseClass, float]] = ()
     
     def __str__(self) -> str:
         return f"{self.tense_class.value} (confidence: {self.confidence:.2f})"
 
 
+# ============================================================================
+# LEXICONS
+# ============================================================================
+# Frozen at module scope: built once, immutable, shared by every extractor.
+
+_HABITUAL_ADVERBS = frozenset({
+    "always", "usually", "often", "never", "rarely", "sometimes",
+    "generally", "typically", "regularly", "every", "once"
+})
+
+_EMOTION_WORDS = frozenset({
+    "scared", "anxious", "worried", "afraid", "frightened",
+    "nervous", "concerned", "stressed", "fearful", "terrified"
+})
+
+_NARRATIVE_MARKERS = frozenset({
+    "so", "then", "suddenly", "next", "after", "later",
+    "finally", "meanwhile", "before", "while"
+})
+
+_COUNTERFACTUAL_PATTERNS = frozenset({
+    "should have", "could have", "would have", "if only",
+    "wish i had", "had only", "i wish"
+})
+
+_BELIEF_VERBS = frozenset({
+    "believe", "think", "know", "suppose", "assume", "consider"
+})
+
+_FATALISTIC_PHRASES = frozenset({
+    "nothing ever changes", "it doesn't matter", "no point",
+    "never works", "always fails", "can't change"
+})
+
+_HEDGE_WORDS = frozenset({
+    "might", "could", "maybe", "perhaps", "seem",
+    "appear", "may", "possibly", "probably"
+})
+
+# The only modal lemmas the scoring rules ever consult
+_TRACKED_MODAL_LEMMAS = frozenset({"will", "would", "should", "could", "might"})
+
+
 # ============================================================================
 # FEATURE EXTRACTION WITH SPACY
 # ============================================================================
@@ -78,144 +172,146 @@ class SpacyFeatureExtractor:
     def __init__(self, spacy_model: str = "en_core_web_sm"):
         """Initialize with spaCy model"""
         try:
-            self.nlp = spacy.load(spacy_model)
+            # Shared across the classifier and the hedge scorer - the
+            # model is only loaded once per process. NER is disabled:
+            # feature extraction never consults entities.
+            self.nlp = get_nlp(spacy_model, disable=("ner",))
             logger.info(f"✓ Loaded spaCy model: {spacy_model}")
-        except OSError:
+        except RuntimeError:
             logger.error(f"✗ spaCy model '{spacy_model}' not found!")
             logger.info("Install with: python -m spacy download en_core_web_sm")
-            raise RuntimeError(
-                f"spaCy model '{spacy_model}' not found. "
-                f"Install with: python -m spacy download {spacy_model}"
-            )
-        
-        # Lexicons
-        self.habitual_adverbs = {
-            "always", "usually", "often", "never", "rarely", "sometimes",
-            "generally", "typically", "regularly", "every", "once"
-        }
-        
-        self.emotion_words = {
-            "scared", "anxious", "worried", "afraid", "frightened",
-            "nervous", "concerned", "stressed", "fearful", "terrified"
-        }
+            raise
         
-        self.narrative_markers = {
-            "so", "then", "suddenly", "next", "after", "later",
-            "finally", "meanwhile", "before", "while"
-        }
-        
-        self.counterfactual_patterns = {
-            "should have", "could have", "would have", "if only",
-            "wish i had", "had only", "i wish"
-        }
-        
-        self.belief_verbs = {
-            "believe", "think", "know", "suppose", "assume", "consider"
-        }
-        
-        self.fatalistic_phrases = {
-            "nothing ever changes", "it doesn't matter", "no point",
-            "never works", "always fails", "can't change"
-        }
+        # Lexicons live as frozenset constants at module scope; keep
+        # instance aliases for backwards compatibility.
+        self.habitual_adverbs = _HABITUAL_ADVERBS
+        self.emotion_words = _EMOTION_WORDS
+        self.narrative_markers = _NARRATIVE_MARKERS
+        self.counterfactual_patterns = _COUNTERFACTUAL_PATTERNS
+        self.belief_verbs = _BELIEF_VERBS
+        self.fatalistic_phrases = _FATALISTIC_PHRASES
         from hedge_scorer import HedgeScorer
         self.hedge_scorer = HedgeScorer(spacy_model)
     
     def extract(self, sentence: str) -> TenseFeatures:
         """Extract features using spaCy"""
-        doc = self.nlp(sentence)
+        return self.extract_from_doc(self.nlp(sentence), sentence)
+
+    def extract_from_doc(self, doc, sentence: str) -> TenseFeatures:
+        """Extract features from an already-parsed Doc (batch path)"""
         text_lower = sentence.lower()
-        root_verb = self._get_root_verb(doc)
-        
-        # Use the advanced HedgeScorer for context-aware hedge detection
-        hedge_result = self.hedge_scorer.analyze(sentence)
+        morph = self._extract_morph_features(doc)
+        modal_lemmas = morph["modal_lemmas"]
+
+        # Use the advanced HedgeScorer for context-aware hedge detection,
+        # handing over the lowered sentence computed above so the scorer
+        # doesn't re-lower the same string
+        hedge_result = self.hedge_scorer.analyze_with_lower(sentence, text_lower)
         features = TenseFeatures(
             # Modals - precise with spaCy
-            has_modal_will=self._has_modal(doc, "will"),
-            has_modal_would=self._has_modal(doc, "would"),
-            has_modal_should=self._has_modal(doc, "should"),
-            has_modal_could=self._has_modal(doc, "could"),
-            has_modal_might=self._has_modal(doc, "might"),
+            has_modal_will="will" in modal_lemmas,
+            has_modal_would="would" in modal_lemmas,
+            has_modal_should="should" in modal_lemmas,
+            has_modal_could="could" in modal_lemmas,
+            has_modal_might="might" in modal_lemmas,
 
             # Structure
             has_if_clause="if" in text_lower,
-            has_subordinate_clause=self._has_subordinate_clause(doc),
+            has_subordinate_clause=morph["has_subordinate_clause"],
 
             # Aspect
             has_counterfactual_aux=self._matches_any(text_lower, self.counterfactual_patterns),
             has_habitual_adverb=self._matches_any(text_lower, self.habitual_adverbs),
-            has_perfective_aspect=self._has_perfective_aspect(doc),
-            has_progressive_aspect=self._has_progressive_aspect(doc),
+            has_perfective_aspect=morph["has_perfective_aspect"],
+            has_progressive_aspect=morph["has_progressive_aspect"],
 
             # Tense - from morphology (spaCy)
-            tense_morph=self._get_tense(root_verb),
+            tense_morph=morph["tense_morph"],
 
             # Semantic
             emotion_words_count=self._count_matches(text_lower, self.emotion_words),
             narrative_markers_count=self._count_matches(text_lower, self.narrative_markers),
-            belief_verb=self._has_belief_verb(doc),
+            belief_verb=morph["belief_verb"],
             fatalistic_phrase=self._matches_any(text_lower, self.fatalistic_phrases),
 
+            # Perfective "have/has been" patterns - checked once here so the
+            # scorer never has to re-lowercase the sentence
+            has_have_been="have been" in text_lower,
+            has_has_been="has been" in text_lower,
+
             # Hedging
             hedge_score=hedge_result.hedge_score,
 
             # Structure
-            first_person=self._has_first_person(doc),
-
-            sentence=sentence,
+            first_person=morph["has_first_person"],
         )
         return features
-    
+
     # ---- Helper Methods ----
-    
-    def _get_root_verb(self, doc):
-        """Find ROOT verb in dependency tree"""
-        for token in doc:
-            if token.dep_ == "ROOT" and token.pos_ in ("VERB", "AUX"):
-                return token
-        return None
-    
-    def _has_modal(self, doc, modal: str) -> bool:
-        """Check for modal by lemma"""
-        return any(t.lemma_ == modal for t in doc if t.pos_ == "AUX")
-    
-    def _has_subordinate_clause(self, doc) -> bool:
-        """Detect subordinate clause"""
-        return any(t.dep_ in ("acl", "advcl", "relcl") for t in doc)
-    
-    def _has_perfective_aspect(self, doc) -> bool:
-        """Check for 'have + past participle'"""
-        for token in doc:
-            if token.lemma_ == "have" and token.pos_ in ("AUX", "VERB"):
-                for child in token.children:
-                    if child.tag_ == "VBN":
-                        return True
-        return False
-    
-    def _has_progressive_aspect(self, doc) -> bool:
-        """Check for 'be + gerund'"""
+
+    def _extract_morph_features(self, doc) -> dict:
+        """
+        Collect all token-level features in a single pass over the doc.
+
+        Replaces seven independent doc scans (root verb, 5x modal check,
+        subordinate clause, perfective/progressive aspect, first person,
+        belief verb) with one loop — same results, ~1/10th the Python
+        iteration overhead.
+        """
+        root_verb = None
+        modal_lemmas: set = set()
+        has_subordinate = False
+        has_perfective = False
+        has_progressive = False
+        has_first_person = False
+
         for token in doc:
-            if token.lemma_ == "be" and token.pos_ == "AUX":
-                for child in token.children:
-                    if child.tag_ == "VBG":
-                        return True
-        return False
-    
-    def _get_tense(self, token) -> str:
-        """Get morphological tense"""
-        if not token:
-            return "Unknown"
-        tense = token.morph.get("Tense")
-        return tense[0] if tense else "Unknown"
-    
-    def _has_first_person(self, doc) -> bool:
-        """Check for I/we"""
-        return any(t.pos_ == "PRON" and t.lemma_ in ("i", "we") for t in doc)
-    
-    def _has_belief_verb(self, doc) -> bool:
-        """Check if root is belief verb"""
-        root = self._get_root_verb(doc)
-        return root and root.lemma_ in self.belief_verbs
-    
+            dep = token.dep_
+            pos = token.pos_
+            lemma = token.lemma_
+
+            if root_verb is None and dep == "ROOT" and pos in ("VERB", "AUX"):
+                root_verb = token
+
+            if pos == "AUX":
+                # Only the five modals the rules consult are worth keeping
+                if lemma in _TRACKED_MODAL_LEMMAS:
+                    modal_lemmas.add(lemma)
+                # 'be + gerund' progressive
+                elif not has_progressive and lemma == "be":
+                    has_progressive = any(c.tag_ == "VBG" for c in token.children)
+
+            if dep in ("acl", "advcl", "relcl"):
+                has_subordinate = True
+
+            # 'have + past participle' perfective
+            if not has_perfective and lemma == "have" and pos in ("AUX", "VERB"):
+                has_perfective = any(c.tag_ == "VBN" for c in token.children)
+
+            if not has_first_person and pos == "PRON" and lemma in ("i", "we"):
+                has_first_person = True
+
+        if root_verb is not None:
+            # Single morph fetch per sentence; morph.get allocates a tuple
+            # on every access, so never call it more than once
+            tense_tuple = root_verb.morph.get("Tense")
+            if tense_tuple:
+                tense_morph = _MORPH_FROM_LABEL.get(tense_tuple[0], TenseMorph.UNKNOWN)
+            else:
+                tense_morph = TenseMorph.UNKNOWN
+        else:
+            tense_morph = TenseMorph.UNKNOWN
+
+        return {
+            "modal_lemmas": modal_lemmas,
+            "has_subordinate_clause": has_subordinate,
+            "has_perfective_aspect": has_perfective,
+            "has_progressive_aspect": has_progressive,
+            "has_first_person": has_first_person,
+            "tense_morph": tense_morph,
+            "belief_verb": root_verb is not None and root_verb.lemma_ in self.belief_verbs,
+        }
+
     def _matches_any(self, text: str, patterns: set) -> bool:
         return any(pat in text for pat in patterns)
     
@@ -224,9 +320,7 @@ class SpacyFeatureExtractor:
     
     def _calculate_hedge_score(self, text: str) -> float:
         """Calculate hedging level"""
-        hedge_words = {"might", "could", "maybe", "perhaps", "seem", 
-                      "appear", "may", "possibly", "probably"}
-        count = sum(1 for w in hedge_words if w in text)
+        count = sum(1 for w in _HEDGE_WORDS if w in text)
         return min(count * 0.15, 1.0)
 
 
@@ -250,7 +344,7 @@ class TenseClassScorer:
         self.rules = {
             TenseClass.ACTIVE_PRESENT: [
                 ScoringRule("present_tense", 
-                           lambda f: 1.0 if f.tense_morph == "Pres" else 0.0, 1.0),
+                           lambda f: 1.0 if f.tense_morph is TenseMorph.PRES else 0.0, 1.0),
                 ScoringRule("first_person",
                            lambda f: 0.7 if f.first_person else 0.0, 0.8),
                 ScoringRule("low_hedging",
@@ -259,14 +353,14 @@ class TenseClassScorer:
             
             TenseClass.HABITUAL_PRESENT: [
                 ScoringRule("present_tense",
-                           lambda f: 1.0 if f.tense_morph == "Pres" else 0.0, 1.0),
+                           lambda f: 1.0 if f.tense_morph is TenseMorph.PRES else 0.0, 1.0),
                 ScoringRule("habitual_marker",
                            lambda f: 1.0 if f.has_habitual_adverb else 0.0, 1.0),
             ],
             
             TenseClass.NARRATIVE_PRESENT: [
                 ScoringRule("present_tense",
-                           lambda f: 0.9 if f.tense_morph == "Pres" else 0.1, 0.9),
+                           lambda f: 0.9 if f.tense_morph is TenseMorph.PRES else 0.1, 0.9),
                 ScoringRule("narrative_marker",
                            lambda f: min(f.narrative_markers_count / 1.0, 1.0), 1.0),
             ],
@@ -275,28 +369,28 @@ class TenseClassScorer:
                 ScoringRule("belief_verb",
                            lambda f: 1.0 if f.belief_verb else 0.0, 1.0),
                 ScoringRule("present_tense",
-                           lambda f: 1.0 if f.tense_morph == "Pres" else 0.5, 0.8),
+                           lambda f: 1.0 if f.tense_morph is TenseMorph.PRES else 0.5, 0.8),
             ],
             
             TenseClass.HISTORICAL_PAST: [
                 ScoringRule("past_tense",
-                           lambda f: 1.0 if f.tense_morph == "Past" else 0.0, 1.0),
+                           lambda f: 1.0 if f.tense_morph is TenseMorph.PAST else 0.0, 1.0),
                 ScoringRule("not_perfective",
                            lambda f: 1.0 if not f.has_perfective_aspect else 0.5, 0.7),
             ],
             
             TenseClass.EXPERIENTIAL_PAST: [
                 ScoringRule("perfective",
-                           lambda f: 1.0 if f.has_perfective_aspect or f.tense_morph == "Perf" else 0.0, 1.0),
+                           lambda f: 1.0 if f.has_perfective_aspect or f.tense_morph is TenseMorph.PERF else 0.0, 1.0),
                 ScoringRule("have_been_pattern",
-                           lambda f: 0.8 if "have been" in f.sentence.lower() or "has been" in f.sentence.lower() else 0.0, 0.9),
+                           lambda f: 0.8 if f.has_have_been or f.has_has_been else 0.0, 0.9),
             ],
             
             TenseClass.COUNTERFACTUAL_PAST: [
                 ScoringRule("counterfactual_pattern",
                            lambda f: 1.0 if f.has_counterfactual_aux else 0.0, 1.0),
                 ScoringRule("past_tense",
-                           lambda f: 1.0 if f.tense_morph == "Past" else 0.0, 0.9),
+                           lambda f: 1.0 if f.tense_morph is TenseMorph.PAST else 0.0, 0.9),
             ],
             
             TenseClass.DECLARED_FUTURE: [
@@ -319,12 +413,12 @@ class TenseClassScorer:
                 ScoringRule("would_modal",
                            lambda f: 1.0 if f.has_modal_would else 0.0, 1.0),
                 ScoringRule("not_present_tense",
-                           lambda f: 1.0 if f.tense_morph != "Pres" else 0.5, 0.8),
+                           lambda f: 1.0 if f.tense_morph is not TenseMorph.PRES else 0.5, 0.8),
             ],
             
             TenseClass.PRESENT_FATALISTIC: [
                 ScoringRule("present_tense",
-                           lambda f: 1.0 if f.tense_morph == "Pres" else 0.1, 0.8),
+                           lambda f: 1.0 if f.tense_morph is TenseMorph.PRES else 0.1, 0.8),
                 ScoringRule("fatalistic_phrase",
                            lambda f: 1.0 if f.fatalistic_phrase else 0.0, 1.0),
             ],
@@ -337,21 +431,38 @@ class TenseClassScorer:
                                             f.has_modal_could) else 0.3, 0.8),
             ],
         }
-    
+
+        # The weight normalizer is constant per class: fold the sum (and the
+        # divide, as a reciprocal multiply) at construction time instead of
+        # recomputing it for every sentence.
+        self._inv_weight_sums = {
+            tense_class: (1.0 / total if (total := sum(r.weight for r in rules)) > 0 else 0.0)
+            for tense_class, rules in self.rules.items()
+        }
+
+        # Flattened scoring plan: (class, (score_func, weight) pairs,
+        # inverse weight sum). score_all walks this tuple instead of the
+        # rules dict, skipping the per-class dict lookups and ScoringRule
+        # attribute loads on every sentence.
+        self._scoring_plan = tuple(
+            (
+                tense_class,
+                tuple((rule.score_func, rule.weight) for rule in rules),
+                self._inv_weight_sums[tense_class],
+            )
+            for tense_class, rules in self.rules.items()
+        )
+
     def score_all(self, features: TenseFeatures) -> Dict[TenseClass, float]:
         """Score all tense classes"""
         scores = {}
-        
-        for tense_class, rules in self.rules.items():
-            rule_scores = []
-            for rule in rules:
-                score = rule.score_func(features) * rule.weight
-                rule_scores.append(score)
-            
-            total_weight = sum(r.weight for r in rules)
-            avg = sum(rule_scores) / total_weight if total_weight > 0 else 0.0
-            scores[tense_class] = avg
-        
+
+        for tense_class, funcs, inv_weight in self._scoring_plan:
+            total = 0.0
+            for score_func, weight in funcs:
+                total += score_func(features) * weight
+            scores[tense_class] = total * inv_weight
+
         return scores
 
 
@@ -366,67 +477,118 @@ class TenseClassifier:
         """Initialize classifier"""
         self.feature_extractor = SpacyFeatureExtractor()
         self.scorer = TenseClassScorer()
+        # Per-instance LRU cache: repeat sentences (tests, explanations, UI
+        # re-renders) skip the full spaCy + scoring pipeline entirely.
+        self.classify = functools.lru_cache(maxsize=4096)(self._classify_uncached)
         logger.info("✓ TenseClassifier initialized successfully\n")
-    
-    def classify(self, sentence: str) -> ClassificationResult:
+
+    def cache_clear(self) -> None:
+        """Clear the classification cache (useful in tests)."""
+        self.classify.cache_clear()
+
+    def _classify_uncached(self, sentence: str) -> ClassificationResult:
         """Classify a sentence"""
         features = self.feature_extractor.extract(sentence)
+        return self._classify_from_features(sentence, features)
+
+    def classify_corpus(
+        self,
+        sentences: List[str],
+        n_process: int = -1,
+        batch_size: int = 128,
+    ):
+        """
+        Classify a large corpus of sentences in bulk.
+
+        Streams sentences through nlp.pipe() so spaCy can batch its
+        forward passes and (with n_process != 1) fan the tagger/parser
+        work out across CPU cores via multiprocessing. The extractor is
+        stateless after init (frozenset lexicons only), so worker
+        processes can pickle it safely.
+
+        Args:
+            sentences: Sentences to classify
+            n_process: Worker processes for spaCy (-1 = all cores)
+            batch_size: Sentences per spaCy batch
+
+        Yields:
+            ClassificationResult per input sentence, in order
+        """
+        extractor = self.feature_extractor
+        docs = extractor.nlp.pipe(
+            sentences, batch_size=batch_size, n_process=n_process
+        )
+        for sentence, doc in zip(sentences, docs):
+            features = extractor.extract_from_doc(doc, sentence)
+            yield self._classify_from_features(sentence, features)
+
+    def _classify_from_features(
+        self, sentence: str, features: TenseFeatures
+    ) -> ClassificationResult:
+        """Score extracted features and build the result"""
         scores = self.scorer.score_all(features)
-        
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        best_class = sorted_scores[0][0]
-        confidence = sorted_scores[0][1]
-        
+
+        # O(n log 3) partial sort instead of sorting all 12 classes
+        top_3 = heapq.nlargest(3, scores.items(), key=itemgetter(1))
+        best_class, confidence = top_3[0]
+
+        # Read-only containers: the result may be served from the
+        # classify cache to many callers
         result = ClassificationResult(
             sentence=sentence,
             tense_class=best_class,
             confidence=confidence,
-            all_scores=scores,
+            all_scores=MappingProxyType(scores),
             features=features,
-            top_3_predictions=[(tc, score) for tc, score in sorted_scores[:3]],
+            top_3_predictions=tuple(top_3),
         )
-        
+
         return result
     
     def explain(self, sentence: str) -> str:
         """Detailed explanation"""
         result = self.classify(sentence)
         f = result.features
-        
-        explanation = f"\n{'='*70}\n"
-        explanation += f"TENSE CLASSIFICATION EXPLANATION\n"
-        explanation += f"{'='*70}\n"
-        explanation += f"Sentence: {sentence}\n\n"
-        
-        explanation += f"RESULT:\n"
-        explanation += f"-" * 70 + "\n"
-        explanation += f"  Class: {result.tense_class.value}\n"
-        explanation += f"  Confidence: {result.confidence:.2f}\n\n"
-        
-        explanation += f"TOP 3 PREDICTIONS:\n"
-        explanation += f"-" * 70 + "\n"
+        rule = "-" * 70
+        bar = "=" * 70
+
+        # Collect the pieces and join once: += on strings reallocates the
+        # whole buffer on every concatenation
+        parts = [
+            f"\n{bar}\n",
+            "TENSE CLASSIFICATION EXPLANATION\n",
+            f"{bar}\n",
+            f"Sentence: {sentence}\n\n",
+            "RESULT:\n",
+            f"{rule}\n",
+            f"  Class: {result.tense_class.value}\n",
+            f"  Confidence: {result.confidence:.2f}\n\n",
+            "TOP 3 PREDICTIONS:\n",
+            f"{rule}\n",
+        ]
         for i, (tc, score) in enumerate(result.top_3_predictions, 1):
-            explanation += f"  {i}. {tc.value:.<40} {score:.2f}\n"
-        explanation += "\n"
-        
-        explanation += f"EXTRACTED FEATURES:\n"
-        explanation += f"-" * 70 + "\n"
-        explanation += f"  Tense: {f.tense_morph}\n"
-        explanation += f"  First person: {f.first_person}\n"
-        explanation += f"  Modals: will={f.has_modal_will}, would={f.has_modal_would}, "
-        explanation += f"could={f.has_modal_could}, might={f.has_modal_might}\n"
-        explanation += f"  Aspects: perfective={f.has_perfective_aspect}, "
-        explanation += f"progressive={f.has_progressive_aspect}\n"
-        explanation += f"  Semantic: emotions={f.emotion_words_count}, "
-        explanation += f"narrative={f.narrative_markers_count}, "
-        explanation += f"belief_verb={f.belief_verb}\n"
-        explanation += f"  Hedge score: {f.hedge_score:.2f}\n"
-        explanation += f"  Counterfactual: {f.has_counterfactual_aux}\n"
-        explanation += f"  If-clause: {f.has_if_clause}\n"
-        explanation += f"  Fatalistic: {f.fatalistic_phrase}\n"
-        explanation += f"\n{'='*70}\n"
-        
-        return explanation
+            parts.append(f"  {i}. {tc.value:.<40} {score:.2f}\n")
+        parts.extend([
+            "\n",
+            "EXTRACTED FEATURES:\n",
+            f"{rule}\n",
+            f"  Tense: {f.tense_morph.label}\n",
+            f"  First person: {f.first_person}\n",
+            f"  Modals: will={f.has_modal_will}, would={f.has_modal_would}, ",
+            f"could={f.has_modal_could}, might={f.has_modal_might}\n",
+            f"  Aspects: perfective={f.has_perfective_aspect}, ",
+            f"progressive={f.has_progressive_aspect}\n",
+            f"  Semantic: emotions={f.emotion_words_count}, ",
+            f"narrative={f.narrative_markers_count}, ",
+            f"belief_verb={f.belief_verb}\n",
+            f"  Hedge score: {f.hedge_score:.2f}\n",
+            f"  Counterfactual: {f.has_counterfactual_aux}\n",
+            f"  If-clause: {f.has_if_clause}\n",
+            f"  Fatalistic: {f.fatalistic_phrase}\n",
+            f"\n{bar}\n",
+        ])
+
+        return "".join(parts)
 
 
 # ============================================================================
@@ -435,6 +597,10 @@ class TenseClassifier:
 
 def run_tests():
     """Run tests"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(message)s'
+    )
     print("\n" + "="*70)
     print("TAS TENSE CLASSIFIER - WITH SPACY")
     print("="*70)
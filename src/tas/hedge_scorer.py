@@ -25,12 +25,27 @@ Hedges stack multiplicatively:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Optional
+import functools
+import math
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional, Sequence
 
-import spacy
 from spacy.tokens import Doc, Token
 
+from nlp_loader import get_nlp
+
+try:
+    import ahocorasick  # optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan  # optional: pip install hyperscan
+except ImportError:
+    hyperscan = None
+
 
 # =============================================================================
 # HEDGE CATEGORIES WITH DISCOUNT FACTORS
@@ -92,41 +107,125 @@ CERTAINTY_BOOSTERS: set[str] = {
 # Modal verbs that indicate uncertainty when used with main verb
 UNCERTAIN_MODAL_LEMMAS: set[str] = {"might", "could", "may"}
 
+# Surface forms that can signal an uncertain modal - checked as cheap
+# substrings before deciding whether a sentence needs a parse at all
+UNCERTAIN_MODAL_SURFACES: frozenset[str] = frozenset({"might", "could", "may"})
+
 # Modal verbs that indicate certainty
 CERTAIN_MODAL_LEMMAS: set[str] = {"will", "shall", "must"}
 
+# Patterns whose hedge status depends on syntax, not mere presence
+_DOC_CHECK_PATTERNS: frozenset[str] = frozenset({"i think", "i believe"})
+
+# The three tiers merged into one scan table at import: (pattern,
+# discount, needs_doc_check), with modal lemmas already filtered out.
+# One loop over this replaces three dict iterations plus a per-pattern
+# modal membership test on every fallback scan.
+_ALL_HEDGE_PATTERNS: tuple[tuple[str, float, bool], ...] = tuple(
+    (pattern, discount, pattern in _DOC_CHECK_PATTERNS)
+    for patterns in (STRONG_HEDGE_PATTERNS, MEDIUM_HEDGE_PATTERNS, LIGHT_HEDGE_PATTERNS)
+    for pattern, discount in patterns.items()
+    if pattern not in UNCERTAIN_MODAL_LEMMAS
+)
+
+# Log-space discounts, precomputed so the final score is one fsum + exp
+# instead of a Python loop of float multiplies (and immune to underflow
+# on long chains). _LOG_HALF is the uncertain-modal discount.
+_LOG_DISCOUNTS: dict[str, float] = {
+    pattern: math.log(discount) for pattern, discount, _needs_doc in _ALL_HEDGE_PATTERNS
+}
+_LOG_HALF = math.log(0.50)
+
+
+def _build_hedge_automaton():
+    """
+    Compile every hedge pattern and certainty booster into one
+    Aho-Corasick automaton.
+
+    One linear pass over the lowered sentence then replaces ~40
+    independent `pattern in text` scans. Modal lemmas are left out of
+    the automaton because analyze() handles them separately via the
+    dependency parse.
+    """
+    automaton = ahocorasick.Automaton()
+    for pattern, discount, _needs_doc in _ALL_HEDGE_PATTERNS:
+        automaton.add_word(pattern, (pattern, discount, False))
+    for booster in CERTAINTY_BOOSTERS:
+        automaton.add_word(booster, (booster, 1.0, True))
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import; None when pyahocorasick is unavailable and the
+# per-pattern substring loops run instead.
+_HEDGE_AC = _build_hedge_automaton() if ahocorasick is not None else None
+
+# Flat id-indexed table of everything the scanners look for: hedges
+# from the merged tier table plus boosters (discount 1.0, is_booster).
+_SCAN_PATTERNS: tuple[tuple[str, float, bool], ...] = tuple(
+    (pattern, discount, False) for pattern, discount, _needs_doc in _ALL_HEDGE_PATTERNS
+) + tuple((booster, 1.0, True) for booster in CERTAINTY_BOOSTERS)
+
+
+def _build_hyperscan_db():
+    """
+    Compile every scan pattern into a single Hyperscan database.
+
+    Hyperscan runs all patterns as one SIMD-vectorized DFA sweep, a step
+    up from the Aho-Corasick pass. Match semantics are identical to the
+    substring tests: patterns are literal-escaped and case-insensitive.
+    """
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(pattern).encode() for pattern, _, _ in _SCAN_PATTERNS],
+        ids=list(range(len(_SCAN_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(_SCAN_PATTERNS),
+    )
+    return db
+
+
+# Preferred scanner when available; falls back to the Aho-Corasick
+# automaton, then to the per-pattern substring loops.
+_HEDGE_HS = _build_hyperscan_db() if hyperscan is not None else None
+
 
 # =============================================================================
 # HEDGE ANALYSIS RESULT
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class HedgeAnalysisResult:
     """
     Complete hedge analysis for a sentence.
-    
+
+    Frozen, with tuple-valued sequences: results are cached and shared
+    (calculate_hedge_score memoizes per input string), so one caller
+    mutating a result must not poison it for everyone else.
+
     Attributes:
         hedge_score: Final certainty score (1.0 = certain, 0.0 = uncertain)
-        detected_hedge_words: List of hedge phrases found in sentence
-        detected_boosters: List of certainty boosters found
+        detected_hedge_words: Hedge phrases found in sentence
+        detected_boosters: Certainty boosters found
         has_uncertain_modal: Whether an uncertain modal verb was detected
         is_heavily_hedged: True if hedge_score < 0.30
-        raw_multiplier_chain: List of individual multipliers applied
+        raw_multiplier_chain: Individual multipliers applied
     """
     
     hedge_score: float = 1.0
-    detected_hedge_words: list[str] = field(default_factory=list)
-    detected_boosters: list[str] = field(default_factory=list)
+    # Shared empty-tuple defaults: most sentences are unhedged, and the
+    # old default_factory=list allocated three lists per result
+    detected_hedge_words: Sequence[str] = ()
+    detected_boosters: Sequence[str] = ()
     has_uncertain_modal: bool = False
     is_heavily_hedged: bool = False
-    raw_multiplier_chain: list[float] = field(default_factory=list)
-    
+    raw_multiplier_chain: Sequence[float] = ()
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
             "hedge_score": round(self.hedge_score, 4),
-            "detected_hedge_words": self.detected_hedge_words,
-            "detected_boosters": self.detected_boosters,
+            "detected_hedge_words": list(self.detected_hedge_words),
+            "detected_boosters": list(self.detected_boosters),
             "has_uncertain_modal": self.has_uncertain_modal,
             "is_heavily_hedged": self.is_heavily_hedged,
         }
@@ -157,17 +256,34 @@ class HedgeScorer:
     def __init__(self, spacy_model_name: str = "en_core_web_sm"):
         """
         Initialize hedge scorer with spaCy model.
-        
+
         Args:
             spacy_model_name: Name of spaCy model to load
         """
-        try:
-            self._nlp = spacy.load(spacy_model_name)
-        except OSError:
-            raise RuntimeError(
-                f"spaCy model '{spacy_model_name}' not found. "
-                f"Install with: python -m spacy download {spacy_model_name}"
-            )
+        # Shared process-wide instance; raises RuntimeError if the model
+        # is not installed. NER is disabled: hedge analysis only needs
+        # POS tags, lemmas and dependency labels, and skipping the NER
+        # stage cuts a chunk of per-doc inference cost.
+        self._nlp = get_nlp(spacy_model_name, disable=("ner",))
+
+        # Integer StringStore hashes for every lemma the predicates test.
+        # Comparing token.lemma (a uint64) against these avoids allocating
+        # a Python string per token via token.lemma_.lower().
+        strings = self._nlp.vocab.strings
+        self._uncertain_modal_hashes = frozenset(
+            strings.add(w) for w in UNCERTAIN_MODAL_LEMMAS
+        )
+        self._think_hash = strings.add("think")
+        self._believe_hash = strings.add("believe")
+        self._about_hash = strings.add("about")
+        self._of_hash = strings.add("of")
+        self._in_hash = strings.add("in")
+        # The only lemmas worth indexing per doc; everything else in the
+        # sentence is dead weight for the predicates below
+        self._indexed_hashes = self._uncertain_modal_hashes | {
+            self._think_hash,
+            self._believe_hash,
+        }
     
     def analyze(self, sentence_text: str) -> HedgeAnalysisResult:
         """
@@ -179,58 +295,232 @@ class HedgeScorer:
         Returns:
             HedgeAnalysisResult with score and detected hedges
         """
-        if not sentence_text or not sentence_text.strip():
-            return HedgeAnalysisResult(hedge_score=1.0)
-        
+        return self.analyze_with_lower(sentence_text, sentence_text.lower())
+
+    def analyze_with_lower(
+        self, sentence_text: str, text_lower: str
+    ) -> HedgeAnalysisResult:
+        """
+        Analyze a sentence whose lowered form the caller already has.
+
+        Upstream code that lowers the message anyway (e.g. alongside
+        contrast-marker detection) can pass both strings and skip the
+        second full-string .lower() allocation here.
+
+        Args:
+            sentence_text: Single sentence to analyze
+            text_lower: sentence_text.lower(), computed by the caller
+
+        Returns:
+            HedgeAnalysisResult with score and detected hedges
+        """
+        short_result = self._short_input_result(sentence_text)
+        if short_result is not None:
+            return short_result
+
+        candidates = self._scan_candidates(text_lower)
+        fast_result = self._try_fast_result(text_lower, candidates)
+        if fast_result is not None:
+            return fast_result
+
         doc = self._nlp(sentence_text)
-        text_lower = sentence_text.lower()
-        
-        detected_hedges: list[str] = []
+        return self._analyze_doc(doc, text_lower, candidates)
+
+    def analyze_batch(
+        self,
+        sentences: list[str],
+        batch_size: int = 64,
+        n_process: int = 1,
+    ):
+        """
+        Analyze many sentences in bulk via nlp.pipe().
+
+        Batching amortizes spaCy's per-doc overhead (and with
+        n_process > 1 fans the tagger/parser across cores), roughly
+        doubling throughput versus per-sentence analyze() calls.
+        Sentences with no hedge candidates never reach spaCy at all.
+
+        Args:
+            sentences: Sentences to analyze
+            batch_size: Sentences per spaCy batch
+            n_process: Worker processes for spaCy (1 = in-process)
+
+        Yields:
+            HedgeAnalysisResult per input sentence, in order
+        """
+        results: list[Optional[HedgeAnalysisResult]] = [None] * len(sentences)
+        pending: list[tuple[int, str, tuple[list[str], dict[str, float]]]] = []
+
+        for i, sentence_text in enumerate(sentences):
+            short_result = self._short_input_result(sentence_text)
+            if short_result is not None:
+                results[i] = short_result
+                continue
+            text_lower = sentence_text.lower()
+            candidates = self._scan_candidates(text_lower)
+            fast_result = self._try_fast_result(text_lower, candidates)
+            if fast_result is not None:
+                results[i] = fast_result
+            else:
+                pending.append((i, text_lower, candidates))
+
+        docs = self._nlp.pipe(
+            [sentences[i] for i, _, _ in pending],
+            batch_size=batch_size,
+            n_process=n_process,
+        )
+        for (i, text_lower, candidates), doc in zip(pending, docs):
+            results[i] = self._analyze_doc(doc, text_lower, candidates)
+
+        yield from results
+
+    def _short_input_result(self, sentence_text: str) -> Optional[HedgeAnalysisResult]:
+        """
+        Resolve empty or very short inputs before any scan or parse.
+
+        Empty/whitespace input scores 1.0 (isspace avoids the stripped
+        copy the old check allocated). Anything under 4 characters is
+        too short to contain a hedge, booster, or modal - except "may",
+        the one 3-character modal surface, which falls through to the
+        full pipeline. Single-word inputs longer than that ("maybe",
+        "probably") can still be hedges and are NOT rejected here.
+        """
+        if not sentence_text or sentence_text.isspace():
+            return HedgeAnalysisResult(hedge_score=1.0)
+        if len(sentence_text) < 4 and "may" not in sentence_text.lower():
+            return HedgeAnalysisResult(hedge_score=1.0)
+        return None
+
+    def _try_fast_result(
+        self,
+        text_lower: str,
+        candidates: tuple[list[str], dict[str, float]],
+    ) -> Optional[HedgeAnalysisResult]:
+        """
+        Return a result without parsing when the text provably needs none.
+
+        A sentence with no candidate hedge pattern and no uncertain-modal
+        surface form can only score 1.0 - boosters alone never lower the
+        score - so the tagger/parser would be wasted work.
+        """
+        detected_boosters, candidate_hedges = candidates
+        if candidate_hedges:
+            return None
+        if any(m in text_lower for m in UNCERTAIN_MODAL_SURFACES):
+            return None
+        return HedgeAnalysisResult(
+            hedge_score=1.0,
+            detected_boosters=tuple(detected_boosters),
+        )
+
+    def _scan_candidates(self, text_lower: str) -> tuple[list[str], dict[str, float]]:
+        """
+        Collect certainty boosters and candidate hedge patterns from the
+        lowered text.
+
+        Purely textual - no parse required - so callers can decide
+        whether a spaCy parse is needed at all based on the outcome. One
+        Hyperscan DFA sweep when available, else one Aho-Corasick pass,
+        else the per-pattern substring loops.
+
+        Returns:
+            (detected_boosters, candidate_hedges) where candidate_hedges
+            maps pattern -> discount factor
+        """
         detected_boosters: list[str] = []
+        candidate_hedges: dict[str, float] = {}
+
+        if _HEDGE_HS is not None:
+            matched_ids: set = set()
+            _HEDGE_HS.scan(
+                text_lower.encode(),
+                match_event_handler=lambda pid, start, end, flags, ctx: matched_ids.add(pid),
+            )
+            for pid in sorted(matched_ids):
+                pattern, discount_factor, is_booster = _SCAN_PATTERNS[pid]
+                if is_booster:
+                    detected_boosters.append(pattern)
+                else:
+                    candidate_hedges[pattern] = discount_factor
+        elif _HEDGE_AC is not None:
+            for _end, (pattern, discount_factor, is_booster) in _HEDGE_AC.iter(text_lower):
+                if is_booster:
+                    if pattern not in detected_boosters:
+                        detected_boosters.append(pattern)
+                else:
+                    candidate_hedges.setdefault(pattern, discount_factor)
+        else:
+            for booster in CERTAINTY_BOOSTERS:
+                if booster in text_lower:
+                    detected_boosters.append(booster)
+            # Modals are already filtered out of the merged table -
+            # they are handled via the dependency parse instead
+            for pattern, discount_factor, _needs_doc in _ALL_HEDGE_PATTERNS:
+                if pattern in text_lower:
+                    candidate_hedges.setdefault(pattern, discount_factor)
+
+        return detected_boosters, candidate_hedges
+
+    def _analyze_doc(
+        self,
+        doc: Doc,
+        text_lower: str,
+        candidates: Optional[tuple[list[str], dict[str, float]]] = None,
+    ) -> HedgeAnalysisResult:
+        """Run hedge analysis steps on an already-parsed Doc."""
+        detected_hedges: list[str] = []
         multiplier_chain: list[float] = []
-        has_uncertain_modal = False
-        
-        # Step 1: Check for certainty boosters (these reduce hedge impact)
-        booster_found = False
-        for booster in CERTAINTY_BOOSTERS:
-            if booster in text_lower:
-                detected_boosters.append(booster)
-                booster_found = True
-        
+        log_chain: list[float] = []
+
+        # Step 1: Find boosters and candidate hedge patterns (one pass,
+        # unless the caller already scanned)
+        if candidates is None:
+            candidates = self._scan_candidates(text_lower)
+        detected_boosters, candidate_hedges = candidates
+        booster_found = bool(detected_boosters)
+
+        # Lemma-hash -> tokens index, built in one pass and shared by
+        # every predicate below instead of each rescanning the whole doc.
+        # Keys are the integer StringStore hashes, and only the handful
+        # of lemmas the predicates actually test are indexed, so the
+        # common token falls through on one frozenset membership check.
+        indexed_hashes = self._indexed_hashes
+        lemma_index: dict[int, list[Token]] = {}
+        for token in doc:
+            if token.lemma in indexed_hashes:
+                lemma_index.setdefault(token.lemma, []).append(token)
+
         # Step 2: Check modal verbs using spaCy dependency parsing
-        has_uncertain_modal = self._detect_uncertain_modal(doc)
+        has_uncertain_modal = self._detect_uncertain_modal(doc, lemma_index)
         if has_uncertain_modal and not booster_found:
             # Only apply modal discount if no certainty booster present
             multiplier_chain.append(0.50)
-            # Find which modal it was
-            for token in doc:
-                if token.lemma_.lower() in UNCERTAIN_MODAL_LEMMAS:
-                    detected_hedges.append(token.text.lower())
-                    break
-        
-        # Step 3: Check multi-word hedge patterns
-        for pattern, discount_factor in STRONG_HEDGE_PATTERNS.items():
-            if self._is_pattern_present_as_hedge(pattern, text_lower, doc):
-                detected_hedges.append(pattern)
-                multiplier_chain.append(discount_factor)
-        
-        for pattern, discount_factor in MEDIUM_HEDGE_PATTERNS.items():
-            # Skip modals - already handled above
-            if pattern in UNCERTAIN_MODAL_LEMMAS:
-                continue
-            if self._is_pattern_present_as_hedge(pattern, text_lower, doc):
-                detected_hedges.append(pattern)
-                multiplier_chain.append(discount_factor)
-        
-        for pattern, discount_factor in LIGHT_HEDGE_PATTERNS.items():
-            if self._is_pattern_present_as_hedge(pattern, text_lower, doc):
+            log_chain.append(_LOG_HALF)
+            # Find which modal it was (earliest in the sentence)
+            modal_tokens = [
+                t
+                for lemma_hash in self._uncertain_modal_hashes
+                for t in lemma_index.get(lemma_hash, ())
+            ]
+            if modal_tokens:
+                detected_hedges.append(
+                    min(modal_tokens, key=lambda t: t.i).text.lower()
+                )
+
+        # Step 3: Verify candidates are really functioning as hedges.
+        # Presence was already established by the scan; only the
+        # syntax-dependent patterns need the doc-level epistemic check.
+        for pattern, discount_factor in candidate_hedges.items():
+            if pattern not in _DOC_CHECK_PATTERNS or self._is_epistemic_hedge(
+                pattern, doc, lemma_index
+            ):
                 detected_hedges.append(pattern)
                 multiplier_chain.append(discount_factor)
-        
-        # Step 4: Calculate final hedge score (multiplicative)
-        final_score = 1.0
-        for multiplier in multiplier_chain:
-            final_score *= multiplier
+                log_chain.append(_LOG_DISCOUNTS[pattern])
+
+        # Step 4: Calculate final hedge score (multiplicative, reduced
+        # in log space: one C-level fsum + exp, no underflow)
+        final_score = math.exp(math.fsum(log_chain)) if log_chain else 1.0
         
         # Step 5: Apply booster effect (partially restore score)
         if booster_found and final_score < 1.0:
@@ -242,98 +532,96 @@ class HedgeScorer:
         # Step 6: Apply floor (minimum 1% certainty)
         final_score = max(0.01, final_score)
         
-        # Remove duplicates from detected hedges
-        detected_hedges = list(dict.fromkeys(detected_hedges))
-        
+        # Tuples (deduplicated for the hedges): the result may be served
+        # from the calculate_hedge_score cache to many callers
         return HedgeAnalysisResult(
             hedge_score=round(final_score, 4),
-            detected_hedge_words=detected_hedges,
-            detected_boosters=detected_boosters,
+            detected_hedge_words=tuple(dict.fromkeys(detected_hedges)),
+            detected_boosters=tuple(detected_boosters),
             has_uncertain_modal=has_uncertain_modal,
             is_heavily_hedged=(final_score < 0.30),
-            raw_multiplier_chain=multiplier_chain,
+            raw_multiplier_chain=tuple(multiplier_chain),
         )
     
-    def _detect_uncertain_modal(self, doc: Doc) -> bool:
+    def _detect_uncertain_modal(
+        self, doc: Doc, lemma_index: dict[int, list[Token]]
+    ) -> bool:
         """
         Check if sentence contains an uncertain modal attached to main verb.
-        
-        This is context-aware: 
+
+        This is context-aware:
         - "I could eat" → modal attached to verb, returns True
         - "Could you help?" → question form, different handling
-        
+
         Args:
             doc: spaCy Doc object
-            
+            lemma_index: Precomputed lemma -> tokens mapping for the doc
+
         Returns:
             True if uncertain modal found modifying a verb
         """
-        for token in doc:
-            # Check if token is an auxiliary verb
-            if token.dep_ == "aux" and token.lemma_.lower() in UNCERTAIN_MODAL_LEMMAS:
-                # Verify it's attached to a verb (not a question inversion)
-                head = token.head
-                if head.pos_ == "VERB":
+        for lemma_hash in self._uncertain_modal_hashes:
+            for token in lemma_index.get(lemma_hash, ()):
+                # Modal attached to a verb (not a question inversion)
+                if token.dep_ == "aux" and token.head.pos_ == "VERB":
                     return True
-            
-            # Also check for modal as main verb pattern
-            if token.pos_ == "AUX" and token.lemma_.lower() in UNCERTAIN_MODAL_LEMMAS:
-                return True
-        
+                # Modal as main verb pattern
+                if token.pos_ == "AUX":
+                    return True
+
         return False
     
-    def _is_pattern_present_as_hedge(
-        self, 
-        pattern: str, 
-        text_lower: str, 
-        doc: Doc
+    def _is_epistemic_hedge(
+        self,
+        pattern: str,
+        doc: Doc,
+        lemma_index: dict[int, list[Token]],
     ) -> bool:
         """
-        Check if a hedge pattern is present AND functioning as a hedge.
-        
+        Check if a syntax-dependent pattern is functioning as a hedge.
+
         Key insight: "I think pizza is good" vs "I think I should go"
         - First: "think" is the main assertion, NOT a hedge
         - Second: "think" weakens the "should go", IS a hedge
-        
+
+        Presence in the text is the caller's responsibility (candidates
+        come from the pattern scan), so no substring re-check here; only
+        patterns in _DOC_CHECK_PATTERNS should be passed in.
+
         Args:
             pattern: Hedge pattern to check (e.g., "i think")
-            text_lower: Lowercased sentence text
             doc: spaCy Doc object
-            
+            lemma_index: Precomputed lemma-hash -> tokens mapping
+
         Returns:
-            True if pattern is present and functioning as a hedge
+            True if the pattern is functioning as a hedge
         """
-        if pattern not in text_lower:
-            return False
-        
-        # Special handling for "I think" - only hedge if followed by another clause
+        # "I think" - only a hedge if followed by another clause
         if pattern == "i think":
-            return self._is_epistemic_i_think(doc)
-        
-        # Special handling for "I believe" - check if stating belief vs hedging
-        if pattern == "i believe":
-            return self._is_epistemic_i_believe(doc)
-        
-        # For other patterns, presence is sufficient
-        return True
+            return self._is_epistemic_i_think(doc, lemma_index)
+
+        # "I believe" - stating a belief vs hedging a claim
+        return self._is_epistemic_i_believe(doc, lemma_index)
     
-    def _is_epistemic_i_think(self, doc: Doc) -> bool:
+    def _is_epistemic_i_think(
+        self, doc: Doc, lemma_index: dict[int, list[Token]]
+    ) -> bool:
         """
         Determine if "I think" is being used as an epistemic hedge.
-        
+
         Hedge: "I think I should go" (weakens "should go")
         Not hedge: "I think about life" (main assertion)
-        
+
         Detection: Look for complementizer clause (that, if) or
         embedded verb after "think"
         """
         think_token: Optional[Token] = None
-        
-        for token in doc:
-            if token.lemma_.lower() == "think" and token.pos_ == "VERB":
+
+        for token in lemma_index.get(self._think_hash, ()):
+            if token.pos_ == "VERB":
                 think_token = token
                 break
-        
+
         if not think_token:
             return False
         
@@ -343,40 +631,38 @@ class HedgeScorer:
             if child.dep_ in ("ccomp", "xcomp", "csubj"):
                 return True
             # "I think about..." is NOT a hedge
-            if child.dep_ == "prep" and child.lemma_ in ("about", "of"):
+            if child.dep_ == "prep" and child.lemma in (self._about_hash, self._of_hash):
                 return False
         
         # Check if there's another verb after "think"
-        found_think = False
-        for token in doc:
-            if token == think_token:
-                found_think = True
-                continue
-            if found_think and token.pos_ == "VERB" and token != think_token:
+        for token in doc[think_token.i + 1:]:
+            if token.pos_ == "VERB":
                 return True
-        
+
         return False
     
-    def _is_epistemic_i_believe(self, doc: Doc) -> bool:
+    def _is_epistemic_i_believe(
+        self, doc: Doc, lemma_index: dict[int, list[Token]]
+    ) -> bool:
         """
         Determine if "I believe" is epistemic hedge vs belief statement.
-        
+
         Hedge: "I believe it might work" (weakens claim)
         Not hedge: "I believe in honesty" (core belief assertion)
         """
         believe_token: Optional[Token] = None
-        
-        for token in doc:
-            if token.lemma_.lower() == "believe" and token.pos_ == "VERB":
+
+        for token in lemma_index.get(self._believe_hash, ()):
+            if token.pos_ == "VERB":
                 believe_token = token
                 break
-        
+
         if not believe_token:
             return False
         
         # "I believe in X" is a belief statement, not a hedge
         for child in believe_token.children:
-            if child.dep_ == "prep" and child.lemma_ == "in":
+            if child.dep_ == "prep" and child.lemma == self._in_hash:
                 return False
             # "I believe that X" with embedded clause is hedging
             if child.dep_ in ("ccomp", "xcomp"):
@@ -401,18 +687,27 @@ def get_default_scorer() -> HedgeScorer:
     return _default_scorer
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_analyze(sentence_text: str) -> HedgeAnalysisResult:
+    """LRU-cached analyze; chat traffic repeats short phrases constantly."""
+    return get_default_scorer().analyze(sentence_text)
+
+
 def calculate_hedge_score(sentence_text: str) -> HedgeAnalysisResult:
     """
     Convenience function to analyze hedge score.
-    
-    Uses a cached singleton HedgeScorer instance.
-    
+
+    Uses a cached singleton HedgeScorer instance. Results are memoized
+    per input string (HedgeAnalysisResult is frozen), so
+    repeated phrases like "maybe" or "i think so" skip spaCy entirely.
+    Cache stats are available via calculate_hedge_score.cache_info().
+
     Args:
         sentence_text: Sentence to analyze
-        
+
     Returns:
         HedgeAnalysisResult with score and details
-        
+
     Example:
         >>> result = calculate_hedge_score("I might kind of want to try it")
         >>> print(result.hedge_score)
@@ -420,5 +715,15 @@ def calculate_hedge_score(sentence_text: str) -> HedgeAnalysisResult:
         >>> print(result.detected_hedge_words)
         ['might', 'kind of']
     """
-    scorer = get_default_scorer()
-    return scorer.analyze(sentence_text)
+    return _cached_analyze(sentence_text)
+
+
+calculate_hedge_score.cache_info = _cached_analyze.cache_info
+calculate_hedge_score.cache_clear = _cached_analyze.cache_clear
+
+
+# Opt-in eager warm-up: loading spaCy at import moves the 1-2s model
+# startup from the first production request to process boot. Lazy by
+# default so tests and tools that never score anything stay fast.
+if os.environ.get("TAS_EAGER_SPACY") == "1":
+    _default_scorer = HedgeScorer()
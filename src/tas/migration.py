@@ -28,10 +28,23 @@ from typing import List, Optional, Dict, Tuple
 from enum import Enum
 import logging
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is an optional accelerator
+    ahocorasick = None
+
 from models import (
     TenseClass,
     MigrationEvent,
     TENSE_CLASS_DISPLAY_NAMES,
+    TENSE_CLASS_TO_INDEX,
 )
 
 # ============================================================================
@@ -72,6 +85,49 @@ MIGRATION_RULES: Dict[Tuple[TenseClass, TenseClass], MigrationEvent] = {
     (TenseClass.STABLE_BELIEF_PRESENT, TenseClass.COUNTERFACTUAL_PAST): MigrationEvent.BELIEF_QUESTIONING,
 }
 
+# Shared integer codes for the 12 tense classes, used to encode
+# histories as int8 arrays for the counting kernel below.
+_TENSE_TO_INT: Dict[TenseClass, int] = TENSE_CLASS_TO_INDEX
+_INT_TO_TENSE: Tuple[TenseClass, ...] = tuple(TenseClass)
+
+# Dominant tense reported for an empty history window
+_DEFAULT_DOMINANT = TenseClass.ACTIVE_PRESENT
+
+# MIGRATION_RULES packed into a dense (prev, curr)-indexed table so the
+# hot-path lookup is a single array load instead of hashing an enum
+# tuple. -1 marks pairs with no migration event.
+_EVENT_TO_INT: Dict[MigrationEvent, int] = {e: i for i, e in enumerate(MigrationEvent)}
+_INT_TO_EVENT: Tuple[MigrationEvent, ...] = tuple(MigrationEvent)
+
+_MIGRATION_TABLE = np.full((len(TenseClass), len(TenseClass)), -1, np.int8)
+for (_prev, _curr), _evt in MIGRATION_RULES.items():
+    _MIGRATION_TABLE[_TENSE_TO_INT[_prev], _TENSE_TO_INT[_curr]] = _EVENT_TO_INT[_evt]
+
+
+def _mode_i8(a):
+    """
+    Most common value in an int8 array.
+
+    Ties break by first occurrence in the array, matching what
+    Counter(values).most_common(1) returned here (Counter preserves
+    insertion order and most_common's sort is stable).
+    """
+    counts = np.zeros(16, np.int32)
+    for v in a:
+        counts[v] += 1
+    best = a[0]
+    best_count = counts[best]
+    for v in a:
+        if counts[v] > best_count:
+            best_count = counts[v]
+            best = v
+    return best
+
+
+if njit is not None:
+    _mode_i8 = njit(cache=True)(_mode_i8)
+
+
 # Contrast markers that indicate intentional shift (not just variation)
 CONTRAST_MARKERS = {
     "but", "however", "though", "yet", "instead",
@@ -81,6 +137,29 @@ CONTRAST_MARKERS = {
 }
 
 
+def _build_contrast_automaton():
+    """Build the Aho-Corasick automaton over CONTRAST_MARKERS, or None."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for marker in CONTRAST_MARKERS:
+        automaton.add_word(marker, marker)
+    automaton.make_automaton()
+    return automaton
+
+
+_CONTRAST_AC = _build_contrast_automaton()
+
+
+def _is_word_bounded(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] is not embedded inside a longer word."""
+    if start > 0 and text[start - 1].isalpha():
+        return False
+    if end < len(text) and text[end].isalpha():
+        return False
+    return True
+
+
 # ============================================================================
 # MIGRATION DETECTOR
 # ============================================================================
@@ -116,8 +195,9 @@ class MigrationDetector:
         prev_tense = tense_history[-2]
         curr_tense = tense_history[-1]
         
-        # Check migration rules
-        migration = MIGRATION_RULES.get((prev_tense, curr_tense))
+        # Check migration rules via the dense lookup table
+        evt_i = _MIGRATION_TABLE[_TENSE_TO_INT[prev_tense], _TENSE_TO_INT[curr_tense]]
+        migration = None if evt_i < 0 else _INT_TO_EVENT[evt_i]
         
         if migration and contrast_markers_present:
             # Boost confidence if contrast markers present
@@ -130,6 +210,41 @@ class MigrationDetector:
         
         return migration
     
+    def detect_migration_batch(
+        self,
+        prev_tenses: np.ndarray,
+        curr_tenses: np.ndarray,
+        contrast_mask: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Detect migrations for many (prev, curr) pairs in one shot.
+
+        Vectorizes the rule-table lookup with advanced indexing, so a
+        scan across thousands of users is one NumPy gather instead of
+        per-row detect_migration calls.
+
+        Args:
+            prev_tenses: int8 tense codes (see _TENSE_TO_INT), one per row
+            curr_tenses: int8 tense codes, same length
+            contrast_mask: Optional bool array marking rows whose message
+                contained contrast markers (used only for logging)
+
+        Returns:
+            int8 array of MigrationEvent codes; -1 = no migration.
+            Map non-negative entries through _INT_TO_EVENT as needed.
+        """
+        events = _MIGRATION_TABLE[prev_tenses, curr_tenses]
+
+        if contrast_mask is not None:
+            confirmed = int(np.count_nonzero((events >= 0) & contrast_mask))
+            if confirmed:
+                logger.info(
+                    "Batch migration scan: %d of %d rows migrated with contrast markers",
+                    confirmed, len(events),
+                )
+
+        return events
+
     def detect_trending_shift(
         self,
         tense_history: List[TenseClass],
@@ -152,13 +267,17 @@ class MigrationDetector:
         if len(tense_history) < window_size:
             return None
         
-        # Get recent window
-        recent = tense_history[-window_size:]
-        
+        # Get recent window, encoded once as int8 codes
+        recent = np.fromiter(
+            (_TENSE_TO_INT[t] for t in tense_history[-window_size:]),
+            dtype=np.int8,
+            count=window_size,
+        )
+
         # Count tenses in first half vs second half
         first_half = recent[:window_size // 2]
         second_half = recent[window_size // 2:]
-        
+
         # Get dominant tense in each half
         first_dominant = self._get_dominant_tense(first_half)
         second_dominant = self._get_dominant_tense(second_half)
@@ -167,7 +286,8 @@ class MigrationDetector:
             return None
         
         # Check if this is a recognized migration
-        migration = MIGRATION_RULES.get((first_dominant, second_dominant))
+        evt_i = _MIGRATION_TABLE[_TENSE_TO_INT[first_dominant], _TENSE_TO_INT[second_dominant]]
+        migration = None if evt_i < 0 else _INT_TO_EVENT[evt_i]
         
         if migration:
             logger.info(
@@ -178,13 +298,11 @@ class MigrationDetector:
         
         return migration
     
-    def _get_dominant_tense(self, tenses: List[TenseClass]) -> TenseClass:
-        """Get most common tense in list"""
-        from collections import Counter
-        if not tenses:
-            return TenseClass.ACTIVE_PRESENT
-        counts = Counter(tenses)
-        return counts.most_common(1)[0][0]
+    def _get_dominant_tense(self, tenses: np.ndarray) -> TenseClass:
+        """Get most common tense in an int8-encoded history window"""
+        if len(tenses) == 0:
+            return _DEFAULT_DOMINANT
+        return _INT_TO_TENSE[int(_mode_i8(tenses))]
     
     def get_migration_interpretation(
         self,
@@ -296,11 +414,25 @@ def detect_contrast_markers(text: str) -> List[str]:
     """
     text_lower = text.lower()
     found = []
-    
+
+    if _CONTRAST_AC is not None:
+        # Single linear pass over the text for all markers at once.
+        # Boundary validation keeps e.g. "now" from matching inside
+        # "know", which the old per-marker substring scans allowed.
+        for end_idx, marker in _CONTRAST_AC.iter(text_lower):
+            start = end_idx - len(marker) + 1
+            if marker not in found and _is_word_bounded(text_lower, start, end_idx + 1):
+                found.append(marker)
+        return found
+
     for marker in CONTRAST_MARKERS:
-        if marker in text_lower:
-            found.append(marker)
-    
+        start = text_lower.find(marker)
+        while start != -1:
+            if _is_word_bounded(text_lower, start, start + len(marker)):
+                found.append(marker)
+                break
+            start = text_lower.find(marker, start + 1)
+
     return found
 
 
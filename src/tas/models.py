@@ -16,10 +16,10 @@ All other TAS files depend on these definitions.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
+import numpy as np
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -141,67 +141,132 @@ TENSE_TO_DEFAULT_GRAPH_OPERATION: dict[TenseClass, GraphOperation] = {
 }
 
 
+# TenseClass cannot become an IntEnum - its "T1".."T12" string values
+# are the wire format the API serializes - so this index map provides
+# the integer identity hot paths use for indexed lookups instead.
+TENSE_CLASS_TO_INDEX: dict[TenseClass, int] = {t: i for i, t in enumerate(TenseClass)}
+
+# The three mappings above flattened into tuples in tense-index order:
+# resolve the enum to an index once, then every lookup is C-level
+# sequence indexing instead of an enum hash per access.
+TENSE_DISPLAY_NAMES_BY_INDEX: tuple[str, ...] = tuple(
+    TENSE_CLASS_DISPLAY_NAMES[t] for t in TenseClass
+)
+TENSE_ORIENTATIONS_BY_INDEX: tuple[TemporalOrientation, ...] = tuple(
+    TENSE_TO_TEMPORAL_ORIENTATION[t] for t in TenseClass
+)
+TENSE_GRAPH_OPERATIONS_BY_INDEX: tuple[GraphOperation, ...] = tuple(
+    TENSE_TO_DEFAULT_GRAPH_OPERATION[t] for t in TenseClass
+)
+
+
 # =============================================================================
 # ZIMBARDO PROFILE
 # =============================================================================
 
-@dataclass(frozen=True)
+# ZimbardoProfile dimensions, in storage order
+_PROFILE_KEYS = (
+    "past_negative",
+    "past_positive",
+    "present_hedonistic",
+    "present_fatalistic",
+    "future_oriented",
+)
+
+
 class ZimbardoProfile:
     """
     Zimbardo Time Perspective Profile.
-    
+
     Based on Philip Zimbardo's research on temporal personality.
     Each dimension represents a stable trait about how someone
     relates to time.
-    
+
     All values normalized to 0.0-1.0 range.
-    Immutable (frozen) for thread safety.
+    Immutable by convention (backed by a private float32 array that is
+    never mutated after construction) for thread safety. Arithmetic
+    like __add__ is one vectorized ufunc call instead of five scalar
+    attribute reads, adds, and min() calls.
     """
-    
-    past_negative: float = 0.0      # Regret, trauma, rumination
-    past_positive: float = 0.0      # Nostalgia, warm memories
-    present_hedonistic: float = 0.0 # Pleasure-seeking, impulsive
-    present_fatalistic: float = 0.0 # Helpless, no agency
-    future_oriented: float = 0.0    # Goal-driven, planning
-    
+
+    __slots__ = ("_v",)
+
+    def __init__(
+        self,
+        past_negative: float = 0.0,      # Regret, trauma, rumination
+        past_positive: float = 0.0,      # Nostalgia, warm memories
+        present_hedonistic: float = 0.0, # Pleasure-seeking, impulsive
+        present_fatalistic: float = 0.0, # Helpless, no agency
+        future_oriented: float = 0.0,    # Goal-driven, planning
+    ):
+        self._v = np.array(
+            [past_negative, past_positive, present_hedonistic,
+             present_fatalistic, future_oriented],
+            dtype=np.float32,
+        )
+
+    @classmethod
+    def _from_array(cls, values: np.ndarray) -> ZimbardoProfile:
+        """Wrap a 5-wide array directly, skipping the per-field unpack."""
+        profile = object.__new__(cls)
+        profile._v = np.asarray(values, dtype=np.float32)
+        return profile
+
+    @property
+    def past_negative(self) -> float:
+        return float(self._v[0])
+
+    @property
+    def past_positive(self) -> float:
+        return float(self._v[1])
+
+    @property
+    def present_hedonistic(self) -> float:
+        return float(self._v[2])
+
+    @property
+    def present_fatalistic(self) -> float:
+        return float(self._v[3])
+
+    @property
+    def future_oriented(self) -> float:
+        return float(self._v[4])
+
     def __add__(self, other: ZimbardoProfile) -> ZimbardoProfile:
         """Add two profiles together (capped at 1.0)."""
-        return ZimbardoProfile(
-            past_negative=min(1.0, self.past_negative + other.past_negative),
-            past_positive=min(1.0, self.past_positive + other.past_positive),
-            present_hedonistic=min(1.0, self.present_hedonistic + other.present_hedonistic),
-            present_fatalistic=min(1.0, self.present_fatalistic + other.present_fatalistic),
-            future_oriented=min(1.0, self.future_oriented + other.future_oriented),
-        )
-    
+        return ZimbardoProfile._from_array(np.minimum(1.0, self._v + other._v))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ZimbardoProfile):
+            return NotImplemented
+        return bool((self._v == other._v).all())
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._v.tolist()))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v}" for k, v in zip(_PROFILE_KEYS, self._v.tolist()))
+        return f"ZimbardoProfile({fields})"
+
     def to_dict(self) -> dict[str, float]:
         """Convert to dictionary."""
-        return {
-            "past_negative": self.past_negative,
-            "past_positive": self.past_positive,
-            "present_hedonistic": self.present_hedonistic,
-            "present_fatalistic": self.present_fatalistic,
-            "future_oriented": self.future_oriented,
-        }
-    
+        return dict(zip(_PROFILE_KEYS, self._v.tolist()))
+
     @property
     def dominant_orientation(self) -> str:
         """Return the dominant temporal orientation."""
-        values = self.to_dict()
-        return max(values, key=lambda k: values[k])
-    
+        # argmax takes the first maximum, matching the old dict-order
+        # max(); no dict or lambda on this per-message path
+        return _PROFILE_KEYS[int(self._v.argmax())]
+
     def normalize(self) -> ZimbardoProfile:
         """Normalize profile so values sum to 1.0."""
-        total = sum(self.to_dict().values())
+        total = float(self._v.sum())
         if total == 0:
             return self
-        return ZimbardoProfile(
-            past_negative=self.past_negative / total,
-            past_positive=self.past_positive / total,
-            present_hedonistic=self.present_hedonistic / total,
-            present_fatalistic=self.present_fatalistic / total,
-            future_oriented=self.future_oriented / total,
-        )
+        # Reciprocal-multiply: one divide + five multiplies beats five
+        # divides (FDIV latency is roughly 10x FMUL)
+        return ZimbardoProfile._from_array(self._v * (1.0 / total))
 
 
 # =============================================================================
@@ -214,9 +279,9 @@ class SentenceAnalysis(BaseModel):
     
     This is the core output unit — one per sentence in the input.
     """
-    
+
     model_config = ConfigDict(frozen=True)
-    
+
     # Original text
     text: str = Field(..., description="Original sentence text")
     
@@ -234,7 +299,12 @@ class SentenceAnalysis(BaseModel):
     
     # Hedge analysis
     hedge_score: float = Field(..., ge=0.0, le=1.0, description="1.0=certain, 0.0=uncertain")
-    hedge_words: list[str] = Field(default_factory=list, description="Detected hedge words")
+    # Tuple-typed so the shared () default is genuinely immutable —
+    # consumers can't mutate one response's words into every other's
+    hedge_words: tuple[str, ...] = Field((), description="Detected hedge words")
+
+    # Sentiment (computed once here; consumed by the Zimbardo accumulator)
+    sentiment_modifier: float = Field(1.0, ge=0.5, le=1.5, description="0.5=negative, 1.5=positive")
     
     # Confidence
     confidence: float = Field(..., ge=0.0, le=1.0, description="Classification confidence")
@@ -251,7 +321,7 @@ class SentenceAnalysis(BaseModel):
     weight_modifier: float = Field(1.0, ge=0.0, le=1.0, description="Weight for graph op")
     
     # Flags
-    flags: list[str] = Field(default_factory=list, description="Special flags")
+    flags: tuple[str, ...] = Field((), description="Special flags")
 
 
 class TASOutput(BaseModel):
@@ -260,9 +330,9 @@ class TASOutput(BaseModel):
     
     Contains all sentence analyses plus aggregated metrics.
     """
-    
+
     model_config = ConfigDict(frozen=True)
-    
+
     # Input
     original_text: str = Field(..., description="Original input message")
     
@@ -294,7 +364,7 @@ class TASOutput(BaseModel):
 
 class TASInput(BaseModel):
     """Input schema for TAS analysis requests."""
-    
+
     message: str = Field(..., min_length=1, description="User message to analyze")
     user_id: str = Field(default="anonymous", description="User identifier")
     session_id: str = Field(default="default", description="Session identifier")
@@ -0,0 +1,56 @@
+"""
+Shared spaCy Model Loader
+=========================
+
+The tense classifier and the hedge scorer both run on en_core_web_sm.
+Loading the model once per (name, disabled-components) pair and sharing
+the Language object saves ~50MB of duplicated weights and the second
+multi-second pipeline startup. Read-only use of a loaded pipeline is
+safe to share across the process.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from typing import Tuple
+
+import spacy
+
+# Serializes first loads so two racing callers never each pay the
+# multi-hundred-MB model load; cache hits only pay the lock handshake.
+_LOAD_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_nlp(model_name: str, disable: Tuple[str, ...]):
+    """Load and cache one pipeline per (model, disabled-components) pair."""
+    try:
+        return spacy.load(model_name, disable=list(disable))
+    except OSError:
+        raise RuntimeError(
+            f"spaCy model '{model_name}' not found. "
+            f"Install with: python -m spacy download {model_name}"
+        )
+
+
+def get_nlp(model_name: str = "en_core_web_sm", disable: Tuple[str, ...] = ()):
+    """
+    Return the process-wide shared spaCy Language object.
+
+    Loaded lazily on first request and cached per
+    (model_name, disable) pair; subsequent callers get the same
+    instance.
+
+    Args:
+        model_name: Name of the spaCy model to load
+        disable: Pipeline components to disable at load time
+
+    Returns:
+        The cached spacy.Language instance
+
+    Raises:
+        RuntimeError: If the model is not installed
+    """
+    with _LOAD_LOCK:
+        return _load_nlp(model_name, tuple(disable))
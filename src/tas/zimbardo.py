@@ -17,23 +17,35 @@ Each tense class contributes fractionally to these dimensions.
 """
 
 from __future__ import annotations
+from types import MappingProxyType
 from typing import Dict, Tuple
 import logging
+import re
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is an optional accelerator
+    ahocorasick = None
 
 from models import (
     TenseClass,
     ZimbardoProfile,
     TENSE_CLASS_DISPLAY_NAMES,
+    TENSE_CLASS_TO_INDEX,
 )
 
 # ============================================================================
 # LOGGING
 # ============================================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -141,22 +153,209 @@ ZIMBARDO_CONTRIBUTIONS: Dict[TenseClass, Dict[str, float]] = {
 }
 
 
+# Read-only view: the matrix below is the hot-path representation, so
+# external mutation of the dict would silently desynchronize the two
+ZIMBARDO_CONTRIBUTIONS = MappingProxyType(ZIMBARDO_CONTRIBUTIONS)
+
+# Profile dimensions in ZimbardoProfile field order
+_KEYS: Tuple[str, ...] = (
+    "past_negative",
+    "past_positive",
+    "present_hedonistic",
+    "present_fatalistic",
+    "future_oriented",
+)
+
+# Shared integer codes for the 12 tense classes, and the contribution
+# table flattened into a contiguous (12, 5) float32 matrix so batch
+# callers can gather whole rows instead of walking dicts per sentence.
+_TENSE_INDEX: Dict[TenseClass, int] = TENSE_CLASS_TO_INDEX
+
+# Display names as a tuple in tense-index order, so the accumulator
+# resolves the enum to an integer once and indexes from there
+_DISPLAY_NAMES: Tuple[str, ...] = tuple(TENSE_CLASS_DISPLAY_NAMES[t] for t in TenseClass)
+
+_CONTRIB = np.array(
+    [[ZIMBARDO_CONTRIBUTIONS[t][k] for k in _KEYS] for t in TenseClass],
+    dtype=np.float32,
+)
+
+# Shared zero delta returned for provably-no-op contributions (fully
+# hedged sentences, unrecognized tense classes); never mutated, so one
+# module singleton replaces a fresh per-call allocation
+_ZERO_PROFILE = ZimbardoProfile()
+
+# Tense classes whose past dimensions are modulated by sentiment
+_SENTIMENT_TENSES = frozenset({TenseClass.HISTORICAL_PAST, TenseClass.EXPERIENTIAL_PAST})
+
+
+def _apply_contribution(state, delta, row, hedge, sentiment_mod, is_past):
+    """
+    Scale one contribution row and fold it into the running state.
+
+    Writes the (uncapped) per-dimension delta into `delta` and updates
+    `state` in place with per-dimension capping at 1.0. JIT-compiled
+    when numba is installed; the pure-Python loop is the fallback.
+    """
+    for i in range(5):
+        v = row[i] * hedge
+        if is_past and sentiment_mod != 1.0:
+            if i == 0:
+                v *= sentiment_mod
+            elif i == 1:
+                v *= 2.0 - sentiment_mod  # Inverse
+        delta[i] = v
+        state[i] = min(1.0, state[i] + v)
+
+
+if njit is not None:
+    _apply_contribution = njit(cache=True, fastmath=True)(_apply_contribution)
+
+    def _warm_apply_contribution() -> None:
+        """Trigger JIT compilation (or cache load) off the request path."""
+        state = np.zeros(5, dtype=np.float32)
+        delta = np.empty(5, dtype=np.float32)
+        _apply_contribution(state, delta, _CONTRIB[0], 1.0, 1.0, False)
+
+    # Compile in the background at import so the first real sentence
+    # never pays the hundreds-of-ms JIT cold start; cache=True persists
+    # the compiled kernel across process restarts.
+    threading.Thread(target=_warm_apply_contribution, daemon=True).start()
+
+
+def _build_updaters():
+    """
+    Generate one specialized update function per tense class.
+
+    The contribution table is static and sparse (1-3 nonzero columns per
+    row), so each generated function touches only its nonzero
+    dimensions, with the contribution constants and the sentiment
+    factors for the past-tense classes baked into the source. Used as
+    the streaming update path when numba is unavailable; with numba the
+    JIT'd generic kernel wins.
+    """
+    updaters = []
+    namespace: dict = {}
+    for i, tense_class in enumerate(TenseClass):
+        is_past = tense_class in _SENTIMENT_TENSES
+        lines = [f"def _upd_{i}(state, hedge, smod):"]
+        deltas = []
+        for j, key in enumerate(_KEYS):
+            coeff = ZIMBARDO_CONTRIBUTIONS[tense_class][key]
+            if coeff == 0.0:
+                deltas.append("0.0")
+                continue
+            expr = f"{coeff!r} * hedge"
+            if is_past and j == 0:
+                expr += " * smod"
+            elif is_past and j == 1:
+                expr += " * (2.0 - smod)"  # Inverse
+            lines.append(f"    d{j} = {expr}")
+            lines.append(f"    state[{j}] = min(1.0, state[{j}] + d{j})")
+            deltas.append(f"d{j}")
+        lines.append(f"    return ({', '.join(deltas)})")
+        exec("\n".join(lines), namespace)
+        updaters.append(namespace[f"_upd_{i}"])
+    return tuple(updaters)
+
+
+# Indexed by tense index, like _CONTRIB
+_UPDATERS = _build_updaters()
+
+
 # ============================================================================
 # SENTIMENT MODIFIERS
 # ============================================================================
 # Additional modifiers based on emotional valence of the content
 
-POSITIVE_SENTIMENT_WORDS = {
+POSITIVE_SENTIMENT_WORDS = frozenset({
     "love", "happy", "great", "amazing", "wonderful", "excellent",
     "proud", "excited", "grateful", "good", "best", "perfect",
     "success", "achieve", "win", "strong", "confident", "capable"
-}
+})
 
-NEGATIVE_SENTIMENT_WORDS = {
+NEGATIVE_SENTIMENT_WORDS = frozenset({
     "hate", "sad", "terrible", "awful", "horrible", "bad",
     "ashamed", "scared", "worried", "anxious", "fail", "weak",
     "struggle", "difficult", "pain", "regret", "sorry", "upset"
-}
+})
+
+# Lowercase word tokenizer for the non-automaton sentiment path
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+
+def _build_sentiment_automaton(words):
+    """
+    Build an Aho-Corasick automaton over a sentiment word set, or None.
+
+    Keys are ASCII bytes: scanning a bytes buffer skips Python's
+    per-codepoint Unicode handling, and bytes.lower() is a straight
+    C-table fold. All sentiment words are plain ASCII.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word.encode("ascii"), word)
+    automaton.make_automaton()
+    return automaton
+
+
+_POS_AC = _build_sentiment_automaton(POSITIVE_SENTIMENT_WORDS)
+_NEG_AC = _build_sentiment_automaton(NEGATIVE_SENTIMENT_WORDS)
+
+
+def _is_ascii_word_bounded(buf: bytes, start: int, end: int) -> bool:
+    """True if buf[start:end] is not embedded inside a longer word."""
+    if start > 0 and 0x61 <= buf[start - 1] <= 0x7A:  # a-z (buffer is lowered)
+        return False
+    if end < len(buf) and 0x61 <= buf[end] <= 0x7A:
+        return False
+    return True
+
+
+def _count_sentiment_hits(automaton, buf: bytes) -> int:
+    """Count distinct sentiment words found in one automaton pass."""
+    hits = set()
+    for end_idx, word in automaton.iter(buf):
+        if word not in hits and _is_ascii_word_bounded(buf, end_idx - len(word) + 1, end_idx + 1):
+            hits.add(word)
+    return len(hits)
+
+
+def get_sentiment_modifier(text: str) -> float:
+    """
+    Get sentiment modifier (0.5-1.5) based on emotional words.
+
+    < 1.0 = negative sentiment
+    = 1.0 = neutral
+    > 1.0 = positive sentiment
+
+    Computed once per sentence upstream (by the analyzer) and passed
+    into the accumulator, so the text is only scanned once.
+    """
+    if _POS_AC is not None:
+        # One linear pass per polarity instead of 36 substring scans,
+        # over an ASCII-folded bytes buffer (non-ASCII is irrelevant to
+        # the word sets). Boundary validation also stops "good"
+        # matching in "goodbye".
+        buf = text.encode("ascii", "ignore").lower()
+        pos_count = _count_sentiment_hits(_POS_AC, buf)
+        neg_count = _count_sentiment_hits(_NEG_AC, buf)
+    else:
+        # Tokenize once and intersect with the hashed word sets: O(L)
+        # tokenize + one hash per token, same boundary semantics as the
+        # automaton path (every sentiment word is a single token)
+        tokens = set(_TOKEN_RE.findall(text.lower()))
+        pos_count = len(tokens & POSITIVE_SENTIMENT_WORDS)
+        neg_count = len(tokens & NEGATIVE_SENTIMENT_WORDS)
+
+    if pos_count + neg_count == 0:
+        return 1.0  # Neutral
+
+    # Range: 0.5 (very negative) to 1.5 (very positive)
+    net_sentiment = (pos_count - neg_count) / (pos_count + neg_count)
+    return 1.0 + (net_sentiment * 0.5)  # Map [-1, 1] to [0.5, 1.5]
 
 
 # ============================================================================
@@ -169,82 +368,85 @@ class ZimbardoAccumulator:
     def __init__(self):
         """Initialize accumulator"""
         logger.info("Initializing ZimbardoAccumulator...")
-        self.current_profile = ZimbardoProfile()
+        # Mutable float32 running state; a ZimbardoProfile is only
+        # materialized when a caller asks for one
+        self._state = np.zeros(5, dtype=np.float32)
+
+    @property
+    def current_profile(self) -> ZimbardoProfile:
+        """The running profile, materialized from the internal state."""
+        return ZimbardoProfile(*self._state.tolist())
     
     def add_tense_contribution(
         self,
         tense_class: TenseClass,
         hedge_score: float = 1.0,
-        text: str = ""
+        sentiment_mod: float = 1.0
     ) -> ZimbardoProfile:
         """
         Add contribution to profile based on tense classification.
-        
+
         Args:
             tense_class: The classified tense
             hedge_score: Certainty level (0-1). Reduces impact if hedged.
-            text: Original text for sentiment analysis
-        
+            sentiment_mod: Sentiment modifier (0.5-1.5), computed once
+                upstream via get_sentiment_modifier()
+
         Returns:
             The delta contribution (not the full profile)
         """
-        
-        # Get base contribution
-        base_contribution = ZIMBARDO_CONTRIBUTIONS.get(
-            tense_class,
-            {k: 0.0 for k in ["past_negative", "past_positive", 
-                              "present_hedonistic", "present_fatalistic", 
-                              "future_oriented"]}
-        )
-        
-        # Apply hedge discount
-        contribution = {k: v * hedge_score for k, v in base_contribution.items()}
-        
-        # Apply sentiment modifier
-        if text:
-            sentiment_mod = self._get_sentiment_modifier(text)
-            if sentiment_mod != 1.0:
-                # Sentiment mostly affects past and present dimensions
-                if tense_class in [TenseClass.HISTORICAL_PAST, TenseClass.EXPERIENTIAL_PAST]:
-                    contribution["past_negative"] *= sentiment_mod
-                    contribution["past_positive"] *= (2.0 - sentiment_mod)  # Inverse
-        
-        # Create profile from contribution
-        delta_profile = ZimbardoProfile(**contribution)
-        
-        # Update running profile
-        self.current_profile = self.current_profile + delta_profile
-        
-        logger.debug(
-            f"Added {TENSE_CLASS_DISPLAY_NAMES[tense_class]} "
-            f"(hedge={hedge_score:.2f}): {delta_profile.to_dict()}"
-        )
-        
+
+        # Fully hedged sentences contribute exactly nothing - skip the
+        # kernel call and delta allocation outright
+        if hedge_score <= 0.0:
+            return _ZERO_PROFILE
+
+        # Resolve the enum to its index once; everything below is
+        # C-level sequence indexing. Unknown classes (the old dict
+        # default) contribute the shared zero row.
+        tense_idx = _TENSE_INDEX.get(tense_class)
+        if tense_idx is None:
+            return _ZERO_PROFILE
+
+        if njit is None:
+            # Specialized per-tense updater: constants baked into the
+            # bytecode, only the row's nonzero dimensions touched
+            delta_profile = ZimbardoProfile(
+                *_UPDATERS[tense_idx](self._state, hedge_score, sentiment_mod)
+            )
+        else:
+            # Sentiment mostly affects past dimensions; it only applies
+            # to the past-tense classes
+            is_past = tense_class in _SENTIMENT_TENSES
+
+            # Scale the contribution row and fold it into the running
+            # state in one JIT'd kernel call
+            delta = np.empty(5, dtype=np.float32)
+            _apply_contribution(
+                self._state,
+                delta,
+                _CONTRIB[tense_idx],
+                hedge_score,
+                sentiment_mod,
+                is_past,
+            )
+            delta_profile = ZimbardoProfile(*delta.tolist())
+
+        # Lazy %-style logging: the to_dict() allocation only happens
+        # when DEBUG is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Added %s (hedge=%.2f): %s",
+                _DISPLAY_NAMES[tense_idx],
+                hedge_score,
+                delta_profile.to_dict(),
+            )
+
         return delta_profile
     
-    def _get_sentiment_modifier(self, text: str) -> float:
-        """
-        Get sentiment modifier (0.5-1.5) based on emotional words.
-        
-        < 1.0 = negative sentiment
-        = 1.0 = neutral
-        > 1.0 = positive sentiment
-        """
-        text_lower = text.lower()
-        
-        pos_count = sum(1 for word in POSITIVE_SENTIMENT_WORDS if word in text_lower)
-        neg_count = sum(1 for word in NEGATIVE_SENTIMENT_WORDS if word in text_lower)
-        
-        if pos_count + neg_count == 0:
-            return 1.0  # Neutral
-        
-        # Range: 0.5 (very negative) to 1.5 (very positive)
-        net_sentiment = (pos_count - neg_count) / (pos_count + neg_count)
-        return 1.0 + (net_sentiment * 0.5)  # Map [-1, 1] to [0.5, 1.5]
-    
     def reset(self) -> None:
         """Reset profile to zero"""
-        self.current_profile = ZimbardoProfile()
+        self._state[:] = 0.0
         logger.info("Zimbardo profile reset")
     
     def get_profile(self) -> ZimbardoProfile:
@@ -261,14 +463,12 @@ class ZimbardoAccumulator:
         
         Useful for comparing profiles on same scale.
         """
-        profile_dict = self.current_profile.to_dict()
-        total = sum(profile_dict.values())
-        
+        total = float(self._state.sum())
+
         if total == 0:
             return self.current_profile
-        
-        normalized = {k: v / total for k, v in profile_dict.items()}
-        return ZimbardoProfile(**normalized)
+
+        return ZimbardoProfile._from_array(self._state * (1.0 / total))
 
 
 # ============================================================================
@@ -276,23 +476,42 @@ class ZimbardoAccumulator:
 # ============================================================================
 
 def accumulate_tense_list(
-    tense_data: list[Tuple[TenseClass, float, str]]
+    tense_data: list[Tuple[TenseClass, float, float]]
 ) -> ZimbardoProfile:
     """
     Accumulate a list of tense classifications into a Zimbardo profile.
-    
+
+    Vectorized: gathers contribution rows from the (12, 5) matrix for
+    the whole batch, scales by the hedge vector, and reduces with one
+    clamped sum instead of building a per-sentence profile. Sentiment
+    only touches the (usually few) past-tense rows. Contributions are
+    non-negative, so one final cap at 1.0 matches the per-step capping
+    the streaming accumulator applies.
+
     Args:
-        tense_data: List of (tense_class, hedge_score, text) tuples
-    
+        tense_data: List of (tense_class, hedge_score, sentiment_mod)
+            tuples; sentiment modifiers come from
+            get_sentiment_modifier(), computed upstream
+
     Returns:
         Aggregated ZimbardoProfile
     """
-    accumulator = ZimbardoAccumulator()
-    
-    for tense_class, hedge_score, text in tense_data:
-        accumulator.add_tense_contribution(tense_class, hedge_score, text)
-    
-    return accumulator.get_profile()
+    if not tense_data:
+        return ZimbardoProfile()
+
+    n = len(tense_data)
+    idx = np.fromiter((_TENSE_INDEX[t] for t, _, _ in tense_data), dtype=np.int8, count=n)
+    hedges = np.fromiter((h for _, h, _ in tense_data), dtype=np.float32, count=n)
+    rows = _CONTRIB[idx] * hedges[:, None]
+
+    for i, (tense_class, _hedge, sentiment_mod) in enumerate(tense_data):
+        if sentiment_mod != 1.0 and tense_class in _SENTIMENT_TENSES:
+            rows[i, 0] *= sentiment_mod
+            rows[i, 1] *= 2.0 - sentiment_mod  # Inverse
+
+    summed = rows.sum(axis=0)
+    np.minimum(summed, 1.0, out=summed)
+    return ZimbardoProfile._from_array(summed)
 
 
 # ============================================================================
@@ -318,7 +537,8 @@ def run_tests():
     print("Adding tense contributions:\n")
     
     for tense_class, hedge_score, text in test_cases:
-        delta = accumulator.add_tense_contribution(tense_class, hedge_score, text)
+        sentiment_mod = get_sentiment_modifier(text)
+        delta = accumulator.add_tense_contribution(tense_class, hedge_score, sentiment_mod)
         print(f"Text: {text}")
         print(f"  Tense: {TENSE_CLASS_DISPLAY_NAMES[tense_class]}")
         print(f"  Hedge: {hedge_score:.2f}")